@@ -1,55 +1,106 @@
-import pandas as pd
+import csv
+
+import numpy as np
 
 # --- Configuration ---
 csv_file_path = 'bus_data.csv'
 num_bins = 5 # The number of colors/categories you want
 
+na_values = {'', 'NA', 'NaN', 'null'} # Cell values treated as missing
+
 # --- Main Script ---
 try:
-    # Load the CSV data into a pandas DataFrame
-    df = pd.read_csv(csv_file_path)
+    # Read only the accel_mean column, once, into a contiguous array; blank
+    # lines, short rows and missing values are skipped
+    with open(csv_file_path, mode='r', encoding='utf-8', newline='') as csv_file:
+        reader = csv.reader(csv_file)
+        col = next(reader).index('accel_mean')
+        vals = np.fromiter(
+            (float(row[col]) for row in reader if len(row) > col and row[col] not in na_values),
+            dtype=float,
+        )
+    vals = vals[~np.isnan(vals)]
+
+    # Summary quantiles (min, quartiles, max) and the bin edges are all taken
+    # from one np.quantile call, so the column is partitioned once instead of
+    # once for the summary and again for the bins
+    summary_levels = np.array([0, 0.25, 0.5, 0.75, 1])
+    bin_levels = np.linspace(0, 1, num_bins + 1)
+    levels = np.concatenate([summary_levels, bin_levels])
+    quantiles = np.quantile(vals, levels)
+    summary, bin_edges = quantiles[:len(summary_levels)], quantiles[len(summary_levels):]
+
+    mean = vals.mean()
+    deviations = vals - mean
+    std = np.sqrt(np.dot(deviations, deviations) / (vals.size - 1))
 
     print("--- Acceleration Data Summary ---")
-    print(df['accel_mean'].describe())
+    print(f"count    {vals.size}")
+    print(f"mean     {mean:.6f}")
+    print(f"std      {std:.6f}")
+    print(f"min      {summary[0]:.6f}")
+    for pct, value in zip((25, 50, 75), summary[1:4]):
+        print(f"{pct}%      {value:.6f}")
+    print(f"max      {summary[4]:.6f}")
     print("\n" + "="*35 + "\n")
 
-    # Use qcut to create bins with roughly equal numbers of data points
-    # `duplicates='drop'` handles cases where many data points have the same value
-    bins = pd.qcut(df['accel_mean'], q=num_bins, duplicates='drop')
-    
-    # Get the value counts for each bin to see the distribution
-    bin_counts = bins.value_counts().sort_index()
+    # Quantile edges give bins with roughly equal numbers of data points;
+    # np.unique drops repeated edges when many points share the same value
+    edges = np.unique(bin_edges)
+    thresholds = edges[1:-1]
+
+    # Bins are closed on the right, matching `accel <= threshold` below
+    bin_counts = np.bincount(np.searchsorted(thresholds, vals), minlength=len(edges) - 1)
 
     # Define a color palette (from red to yellow to green)
     # You can find more palettes at sites like colorbrewer2.org
     color_palette = ['#d73027', '#fc8d59', '#fee08b', '#d9ef8b', '#91cf60']
-    
+
     print("--- Recommended Thresholds for index.html ---")
-    print("Copy the following logic into the getColor() function in your HTML file.\n")
+    print("Copy the following constants and getColor() function into your HTML file.\n")
 
-    # Generate the JavaScript if/else logic and print the thresholds
-    js_logic = ""
-    for i, interval in enumerate(bin_counts.index):
-        # The upper bound of the interval is the threshold
-        threshold = interval.right
+    # Print the thresholds for each bin
+    for i, count in enumerate(bin_counts):
         color = color_palette[i]
-        
-        if i < len(bin_counts) - 1:
-            print(f"Bin {i+1}: accel_mean <= {threshold:.4f}  ->  Color: {color}")
-            js_logic += f"        return accel <= {threshold:.4f} ? '{color}' :\n"
+
+        if len(bin_counts) == 1:
+            # Every value is the same, so there is nothing to split on
+            print(f"Bin 1: all values  ->  Color: {color}  ({count} points)")
+        elif i < len(bin_counts) - 1:
+            # The upper edge of the bin is the threshold
+            print(f"Bin {i+1}: accel_mean <= {thresholds[i]:.4f}  ->  Color: {color}  ({count} points)")
         else:
             # The last bin catches everything else
-            print(f"Bin {i+1}: accel_mean > {bin_counts.index[i-1].right:.4f}  ->  Color: {color}")
-            js_logic += f"               '{color}'; // Default for highest values"
+            print(f"Bin {i+1}: accel_mean > {thresholds[i-1]:.4f}  ->  Color: {color}  ({count} points)")
+
+    # Bake the thresholds into a typed array and look colors up with a
+    # binary search, so each point costs O(log bins) comparisons instead of
+    # walking a chained ternary. Float64Array keeps the comparison exact for
+    # values that sit right on a threshold.
+    threshold_list = ", ".join(f"{threshold:.4f}" for threshold in thresholds)
+    color_list = ", ".join(f"'{color}'" for color in color_palette[:len(bin_counts)])
+    js_lines = [
+        f"const ACCEL_THRESHOLDS = new Float64Array([{threshold_list}]);",
+        f"const ACCEL_COLORS = [{color_list}];",
+        "",
+        "function getColor(accel) {",
+        "    // first bin whose threshold is >= accel; past the end means highest bin",
+        "    let lo = 0, hi = ACCEL_THRESHOLDS.length;",
+        "    while (lo < hi) {",
+        "        const mid = (lo + hi) >>> 1;",
+        "        if (accel <= ACCEL_THRESHOLDS[mid]) hi = mid;",
+        "        else lo = mid + 1;",
+        "    }",
+        "    return ACCEL_COLORS[lo];",
+        "}",
+    ]
+    js_logic = "\n".join(js_lines)
 
     print("\n--- JavaScript getColor() Function ---")
-    print("function getColor(accel) {")
     print(js_logic)
-    print("}")
 
 
 except FileNotFoundError:
     print(f"Error: The file '{csv_file_path}' was not found.")
 except Exception as e:
     print(f"An error occurred: {e}")
-
@@ -1,60 +1,114 @@
-import csv
-import json
+import os
+
+import numpy as np
+import pandas as pd
+
+# orjson is much faster and returns bytes directly; fall back to the
+# standard library when it is not installed
+try:
+    import orjson
+
+    def dumps(obj):
+        return orjson.dumps(obj)
+except ImportError:
+    import json
+
+    def dumps(obj):
+        return json.dumps(obj).encode('utf-8')
 
 # Input and output file names
 csv_file_path = 'bus_data.csv'
 geojson_file_path = 'bus_route.geojson'
 
-# The main structure for our GeoJSON file
-geojson = {
-    "type": "FeatureCollection",
-    "features": []
-}
-
-# Open the CSV file and read it
-with open(csv_file_path, mode='r', encoding='utf-8') as csv_file:
-    # Use DictReader to read rows as dictionaries
-    csv_reader = csv.DictReader(csv_file)
-
-    for row in csv_reader:
-        # Skip rows with invalid coordinates
-        try:
-            longitude = float(row['longitude'])
-            latitude = float(row['latitude'])
-        except (ValueError, KeyError):
-            print(f"Skipping row due to invalid coordinates: {row}")
+# Rows read from the CSV at a time; only one chunk is held in memory
+chunk_size = 50_000
+
+
+def coerce_numeric_columns(df):
+    """Convert text columns whose every non-empty value parses as a number."""
+    for col in df.columns:
+        if pd.api.types.is_numeric_dtype(df[col]):
             continue
+        numeric = pd.to_numeric(df[col], errors='coerce')
+        if numeric.notna().sum() == df[col].notna().sum():
+            df[col] = numeric
+    return df
 
-        # *** MODIFIED AREA START ***
-        # Dynamically build the properties dictionary from all columns
-        properties = {}
-        for key, value in row.items():
-            # Exclude latitude and longitude as they are used for geometry
-            if key.lower() in ['latitude', 'longitude']:
-                continue
-            
-            # Try to convert numeric strings to actual numbers (float)
-            # Otherwise, keep them as strings (e.g., for the timestamp)
-            try:
-                properties[key] = float(value)
-            except (ValueError, TypeError):
-                properties[key] = value
-        # *** MODIFIED AREA END ***
-
-        # Create a GeoJSON Feature for each row
-        feature = {
+
+def read_chunks(path):
+    """Yield the CSV in chunks of chunk_size rows; an empty file yields nothing."""
+    try:
+        reader = pd.read_csv(path, chunksize=chunk_size)
+    except pd.errors.EmptyDataError:
+        return
+    with reader:
+        yield from reader
+
+
+def build_features(df):
+    """Turn a chunk of CSV rows into a list of GeoJSON Feature dicts."""
+    # Without coordinate columns no row can become a Point
+    missing = [col for col in ('longitude', 'latitude') if col not in df.columns]
+    if missing:
+        print(f"Skipping {len(df)} rows due to missing column(s): {', '.join(missing)}")
+        return []
+
+    # Coordinates that fail to parse become NaN; drop those rows along with
+    # any infinite ones
+    df['longitude'] = pd.to_numeric(df['longitude'], errors='coerce')
+    df['latitude'] = pd.to_numeric(df['latitude'], errors='coerce')
+    valid = np.isfinite(df['longitude']) & np.isfinite(df['latitude'])
+    if not valid.all():
+        print(f"Skipping {(~valid).sum()} rows due to invalid coordinates.")
+    df = df[valid]
+
+    # GeoJSON format is [longitude, latitude]
+    coords = df[['longitude', 'latitude']].to_numpy().tolist()
+
+    # Every other column becomes a property; empty and non-finite cells are
+    # written as null, which orjson and json would otherwise disagree on
+    props_df = coerce_numeric_columns(df.drop(columns=['latitude', 'longitude']))
+    props_df = props_df.replace([np.inf, -np.inf], np.nan)
+    props_df = props_df.astype(object).where(props_df.notna(), None)
+    properties = props_df.to_dict(orient='records')
+
+    return [
+        {
             "type": "Feature",
             "geometry": {
                 "type": "Point",
-                "coordinates": [longitude, latitude] # GeoJSON format is [longitude, latitude]
+                "coordinates": coordinates
             },
-            # Assign the fully populated properties dictionary
-            "properties": properties
+            "properties": props
         }
-        geojson['features'].append(feature)
+        for coordinates, props in zip(coords, properties)
+    ]
+
+
+# Stream the FeatureCollection to disk one chunk at a time so memory use
+# does not grow with the size of the CSV. Write to a temporary file next to
+# the output and move it into place only once every chunk has been written,
+# so a failure partway through never leaves a truncated GeoJSON behind.
+tmp_path = geojson_file_path + '.tmp'
+try:
+    with open(tmp_path, 'wb') as geojson_file:
+        geojson_file.write(b'{"type": "FeatureCollection", "features": [\n')
+
+        first = True
+        for chunk in read_chunks(csv_file_path):
+            serialized = [dumps(feature) for feature in build_features(chunk)]
+            if not serialized:
+                continue
+            if not first:
+                geojson_file.write(b',\n')
+            geojson_file.write(b',\n'.join(serialized))
+            first = False
 
-# Write the GeoJSON data to a file
-with open(geojson_file_path, 'w') as geojson_file:
-    json.dump(geojson, geojson_file, indent=2)
+        geojson_file.write(b'\n]}\n')
+    os.replace(tmp_path, geojson_file_path)
+except BaseException:
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+    raise
 
 print(f"Successfully converted {csv_file_path} to {geojson_file_path} with all properties included.")